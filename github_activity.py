@@ -0,0 +1,331 @@
+import requests
+import argparse
+import functools
+import orjson
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "github-activity"
+MAX_EVENTS = 300
+PAGE_SIZE = 100
+
+_EMPTY_TUPLE = ()
+_S = ("", "s")
+
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'Accept': 'application/vnd.github.v3+json',
+    'User-Agent': 'github-activity-cli'
+})
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="github-activity",
+                                     description="Fetch the recent public events of the given GitHub user"
+                                                 f" (30 by default, up to {MAX_EVENTS})")
+    parser.add_argument("username", help="username of the GitHub user", type=str)
+    parser.add_argument("-n", "--count", help=f"number of events to fetch (max {MAX_EVENTS})",
+                        type=int, default=30)
+    args = parser.parse_args()
+
+    username = args.username
+    count = max(1, min(args.count, MAX_EVENTS))
+
+    events = fetch_events(username, count)
+
+    handlers_get = HANDLERS.get
+    lines = []
+
+    for event in events:
+        event_type = sys.intern(event.get("type", ""))
+
+        event_handler = handlers_get(event_type)
+        if event_handler:
+            payload = event.get("payload") or {}
+            repo = (event.get("repo") or {}).get("name", "Unknown")
+            result = event_handler(event, payload, repo)
+            if isinstance(result, str):
+                lines.append(result)
+            else:
+                lines.extend(result)
+        else:
+            lines.append("- Unknown Event")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def fetch_events(username, count):
+    if count <= PAGE_SIZE:
+        endpoint = f"https://api.github.com/users/{username}/events?per_page={count}"
+        return get_response(endpoint, username, int(time.time()) // 60)
+
+    pages = -(-count // PAGE_SIZE)
+    endpoints = [f"https://api.github.com/users/{username}/events?per_page={PAGE_SIZE}&page={page}"
+                 for page in range(1, pages + 1)]
+
+    with ThreadPoolExecutor(max_workers=pages) as pool:
+        responses = list(pool.map(lambda endpoint: fetch_page(endpoint, username), endpoints))
+
+    events = [event for r in responses for event in orjson.loads(r.content)]
+    return events[:count]
+
+
+def fetch_page(endpoint, username, headers=None):
+    try:
+        r = _SESSION.get(endpoint, headers=headers)
+        r.raise_for_status()
+    except requests.exceptions.ConnectionError as err:
+        raise SystemExit(err)
+    except requests.exceptions.HTTPError as err:
+        if r.status_code == 404:
+            raise SystemExit(f"User '{username}' not found")
+        elif r.status_code == 403:
+            raise SystemExit("Rate limit exceeded or access forbidden")
+        raise SystemExit(err)
+
+    return r
+
+
+@functools.lru_cache(maxsize=16)
+def get_response(endpoint, username, _bucket=None):
+
+    headers = {}
+
+    cached = read_cache(username)
+    if cached:
+        headers['If-None-Match'] = cached["etag"]
+
+    r = fetch_page(endpoint, username, headers)
+
+    if r.status_code == 304:
+        return cached["events"]
+
+    events = orjson.loads(r.content)
+
+    etag = r.headers.get("ETag")
+    if etag:
+        write_cache(username, etag, events)
+
+    return events
+
+
+def read_cache(username):
+    try:
+        with open(CACHE_DIR / f"{username}.json", "rb") as f:
+            cached = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    if isinstance(cached, dict) and "etag" in cached and "events" in cached:
+        return cached
+    return None
+
+
+def write_cache(username, etag, events):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_DIR / f"{username}.json", "wb") as f:
+            f.write(orjson.dumps({"etag": etag, "events": events}))
+    except OSError:
+        pass
+
+_FMT_COMMIT_COMMENT = "- Commented on commit {cid} in {repo}: {body}".format
+_FMT_CREATE_REPO = "- Created repo: {repo}".format
+_FMT_CREATE_REF = "- Created {ref_type} '{ref}' in {repo}".format
+_FMT_CREATE_OTHER = "- Created {ref_type} in {repo}".format
+_FMT_DELETE_REPO = "- Deleted repo: {repo}".format
+_FMT_DELETE_REF = "- Deleted {ref_type} in {repo}".format
+_FMT_FORK = "- Forked repo {repo}".format
+_FMT_WIKI = "- {action} wiki page '{title}'".format
+_FMT_ISSUE_COMMENT = "- {action} comment '{title}' in {repo}: {body}".format
+_FMT_ISSUES = "- {action} issue in {repo}: {title}".format
+_FMT_MEMBER_OTHER = "- {action} {member} on {repo}".format
+_FMT_PUBLIC = "- Made {repo} public".format
+_FMT_PULL_REQUEST = "- Pull request {action} on {repo}: {title}".format
+_FMT_PR_REVIEW = "- {action} PR in {repo} ".format
+_FMT_PR_REVIEW_COMMENT = "- {action} review comment on PR '{title}' in {repo}: {body}".format
+_FMT_PR_REVIEW_THREAD = "- {action} review thread on PR '{title}' in {repo}".format
+_FMT_PUSH = "- Pushed {n} commit{s} to {repo}".format
+_FMT_RELEASE = "- {action} {release} of {repo}".format
+_FMT_SPONSOR_CREATED = "- {sponsor} just started sponsoring {sponsorable}!".format
+_FMT_SPONSOR_CANCELLED = "- {sponsor} cancelled their sponsorship of {sponsorable}".format
+_FMT_SPONSOR_TIER = "- {sponsor} changed their sponsorship tier for {sponsorable}".format
+_FMT_SPONSOR_OTHER = "- {sponsor} {action} sponsorship of {sponsorable}".format
+_FMT_WATCH = "- Starred {repo}".format
+
+_CAPS = {action: action.capitalize() for action in (
+    "opened", "closed", "created", "edited", "deleted", "added", "removed",
+    "reopened", "synchronize", "tier_changed", "cancelled", "published",
+    "submitted", "dismissed", "resolved", "unresolved"
+)}
+
+_MEMBER_FMTS = {
+    "added": "- Added {member} as collaborator to {repo}".format,
+    "removed": "- Removed {member} from {repo}".format,
+    "edited": "- Changed {member}'s permissions on {repo}".format
+}
+
+
+def _cap(action):
+    return _CAPS.get(action) or action.capitalize()
+
+
+def _dig(d, path, default=""):
+    for key in path:
+        d = d.get(key) if isinstance(d, dict) else None
+        if d is None:
+            return default
+    return d
+
+
+def _trunc(s, n):
+    return s if len(s) <= n else s[:n]
+
+
+def handle_commit_comment_event(event, payload, repo):
+    commit_id = _dig(payload, ("comment", "commit_id"), "Unknown")
+    comment_text = _dig(payload, ("comment", "body"), "No Comment")
+    return _FMT_COMMIT_COMMENT(cid=_trunc(commit_id, 7), repo=repo, body=_trunc(comment_text, 50))
+
+
+def handle_create_event(event, payload, repo):
+    ref_type = payload.get("ref_type")
+    ref = payload.get("ref")
+    if ref_type == "repository":
+        return _FMT_CREATE_REPO(repo=repo)
+    elif ref_type in ["branch", "tag"] and ref:
+        return _FMT_CREATE_REF(ref_type=ref_type, ref=ref, repo=repo)
+    else:
+        return _FMT_CREATE_OTHER(ref_type=ref_type, repo=repo)
+
+
+def handle_delete_event(event, payload, repo):
+    ref_type = payload.get("ref_type")
+    if ref_type == "repository":
+        return _FMT_DELETE_REPO(repo=repo)
+    else:
+        return _FMT_DELETE_REF(ref_type=ref_type, repo=repo)
+
+
+def handle_fork_event(event, payload, repo):
+    return _FMT_FORK(repo=repo)
+
+
+def handle_gollum_event(event, payload, repo):
+    for page in payload.get("pages") or _EMPTY_TUPLE:
+        if isinstance(page, dict):
+            page_title = page.get("title", "Unknown")
+            page_action = page.get("action", "Unknown")
+            yield _FMT_WIKI(action=_cap(page_action), title=page_title)
+
+
+def handle_issue_comment_event(event, payload, repo):
+    action = payload.get("action", "")
+    issue_title = _dig(payload, ("issue", "title"), "")
+    comment_body = _trunc(_dig(payload, ("comment", "body"), ""), 50)
+    return _FMT_ISSUE_COMMENT(action=_cap(action), title=issue_title, repo=repo, body=comment_body)
+
+
+def handle_issues_event(event, payload, repo):
+    action = payload.get("action", "")
+    issue = _dig(payload, ("issue", "title"), "")
+    return _FMT_ISSUES(action=_cap(action), repo=repo, title=issue)
+
+
+def handle_member_event(event, payload, repo):
+    action = payload.get("action", "")
+    member = _dig(payload, ("member", "login"), "Unknown")
+
+    fmt = _MEMBER_FMTS.get(action)
+    if fmt:
+        return fmt(member=member, repo=repo)
+    return _FMT_MEMBER_OTHER(action=action, member=member, repo=repo)
+
+
+def handle_public_event(event, payload, repo):
+    return _FMT_PUBLIC(repo=repo)
+
+
+def handle_pull_request_event(event, payload, repo):
+    action = payload.get("action", "")
+    pull_request = _dig(payload, ("pull_request", "title"), "")
+    return _FMT_PULL_REQUEST(action=action, repo=repo, title=pull_request)
+
+
+def handle_pull_request_review_event(event, payload, repo):
+    action = payload.get("action", "")
+    return _FMT_PR_REVIEW(action=_cap(action), repo=repo)
+
+
+def handle_pull_request_review_comment_event(event, payload, repo):
+    action = payload.get("action", "")
+    comment_text = _trunc(_dig(payload, ("comment", "body"), ""), 50)
+    pr_title = _dig(payload, ("pull_request", "title"), "")
+    return _FMT_PR_REVIEW_COMMENT(action=_cap(action), title=pr_title, repo=repo, body=comment_text)
+
+
+def handle_pull_request_review_thread_event(event, payload, repo):
+    action = payload.get("action", "")
+    pull_request = _dig(payload, ("pull_request", "title"), "")
+    return _FMT_PR_REVIEW_THREAD(action=_cap(action), title=pull_request, repo=repo)
+
+
+def handle_push_event(event, payload, repo):
+    commits = len(payload.get("commits") or _EMPTY_TUPLE)
+    return _FMT_PUSH(n=commits, s=_S[commits != 1], repo=repo)
+
+
+def handle_release_event(event, payload, repo):
+    action = payload.get("action", "")
+    release = _dig(payload, ("release", "name"), "")
+    return _FMT_RELEASE(action=_cap(action), release=release, repo=repo)
+
+
+def handle_sponsorship_event(event, payload, repo):
+    action = payload.get("action", "unknown")
+    sponsor = _dig(payload, ("sponsorship", "sponsor", "login"), "Unknown")
+    sponsorable = _dig(payload, ("sponsorship", "sponsorable", "login"), "Unknown")
+
+    match action:
+        case "created":
+            return _FMT_SPONSOR_CREATED(sponsor=sponsor, sponsorable=sponsorable)
+        case "cancelled":
+            return _FMT_SPONSOR_CANCELLED(sponsor=sponsor, sponsorable=sponsorable)
+        case "tier_changed":
+            return _FMT_SPONSOR_TIER(sponsor=sponsor, sponsorable=sponsorable)
+        case _:
+            return _FMT_SPONSOR_OTHER(sponsor=sponsor, action=action, sponsorable=sponsorable)
+
+
+def handle_watch_event(event, payload, repo):
+    return _FMT_WATCH(repo=repo)
+
+
+HANDLERS = {
+    "CommitCommentEvent": handle_commit_comment_event,
+    "CreateEvent": handle_create_event,
+    "DeleteEvent": handle_delete_event,
+    "ForkEvent": handle_fork_event,
+    "GollumEvent": handle_gollum_event,
+    "IssueCommentEvent": handle_issue_comment_event,
+    "IssuesEvent": handle_issues_event,
+    "MemberEvent": handle_member_event,
+    "PublicEvent": handle_public_event,
+    "PullRequestEvent": handle_pull_request_event,
+    "PullRequestReviewEvent": handle_pull_request_review_event,
+    "PullRequestReviewCommentEvent": handle_pull_request_review_comment_event,
+    "PullRequestReviewThreadEvent": handle_pull_request_review_thread_event,
+    "PushEvent": handle_push_event,
+    "ReleaseEvent": handle_release_event,
+    "SponsorshipEvent": handle_sponsorship_event,
+    "WatchEvent": handle_watch_event
+}
+HANDLERS = {sys.intern(event_type): handler for event_type, handler in HANDLERS.items()}
+
+
+if __name__ == "__main__":
+    main()